@@ -64,7 +64,7 @@ about these products or any other products we offer?
 """
 
 response = client.moderations.create(
-    input=final_response_to_customer, model=OpenAIModels.gpt4_1.value
+    input=final_response_to_customer, model=OpenAIModels.gpt4_1
 )
 print(response)
 moderation_output = response["results"][0]
@@ -26,7 +26,7 @@ def get_openai_completion_from_messages(
 
     Args:
         messages (list): List of message dicts with 'role' and 'content'.
-        model (OpenAIModels): Model enum to use for completion.
+        model (str): Model name to use for completion, e.g. OpenAIModels.gpt4_1.
         temperature (float): Sampling temperature.
         max_tokens (int): Maximum number of tokens in the response.
 
@@ -9,6 +9,8 @@ Outline:
 
 import os
 import sys
+import shelve
+import threading
 from dotenv import load_dotenv
 
 # Add src directory to Python path for imports
@@ -31,6 +33,10 @@ from enums.ai_models import OpenAIModels
 load_dotenv()
 os.system("clear")
 
+# Build the separator lines once instead of on every print
+SEP = separator(count=80)
+DASH = "-" * 80
+
 # Safely load your API key from environment
 api_key = os.getenv("REQUESTY_API_KEY")
 if not api_key:
@@ -53,17 +59,17 @@ except Exception as e:
 # ✅ ASSERTION
 assert llm is not None, "Chat model not initialized"
 
-print(separator(count=80))
+print(SEP)
 print("[+] LANGCHAIN AGENTS - UPDATED FOR 1.2.7")
-print(separator(count=80))
+print(SEP)
 
 # ============================================================================
 # EXAMPLE 1: SIMPLE CALCULATOR AGENT
 # ============================================================================
 
-print(separator(count=80))
+print(SEP)
 print("[+] EXAMPLE 1: CALCULATOR TOOL")
-print(separator(count=80))
+print(SEP)
 
 
 @tool
@@ -97,7 +103,7 @@ agent = create_agent(
 )
 
 print("[+] Testing agent with math question:")
-print("-" * 80)
+print(DASH)
 
 result = agent.invoke(
     {"messages": [{"role": "user", "content": "What is 25% of 300?"}]}
@@ -109,14 +115,39 @@ print(f"\n[+] Answer: {result['messages'][-1].content}\n")
 # EXAMPLE 2: WIKIPEDIA AGENT
 # ============================================================================
 
-print(separator(count=80))
+print(SEP)
 print("[+] EXAMPLE 2: WIKIPEDIA TOOL")
-print(separator(count=80))
+print(SEP)
 
-wikipedia = WikipediaQueryRun(
+wikipedia_api = WikipediaQueryRun(
     api_wrapper=WikipediaAPIWrapper(top_k_results=1, doc_content_chars_max=500)  # type: ignore
 )
 
+# Disk cache for Wikipedia lookups: the same demo queries hit the same
+# articles on every run, so skip the HTTP round-trip when we've seen them.
+WIKI_CACHE_PATH = os.path.join(os.path.dirname(__file__), ".wiki_cache")
+# The agent may run tool calls in parallel threads; shelve isn't safe for
+# concurrent access, so only one thread has the shelf open at a time
+WIKI_CACHE_LOCK = threading.Lock()
+
+
+@tool
+def wikipedia(query: str) -> str:
+    """A wrapper around Wikipedia. Useful for when you need to answer general
+    questions about people, places, companies, facts, historical events, or
+    other subjects. Input should be a search query."""
+    key = query.lower().strip()
+    with WIKI_CACHE_LOCK, shelve.open(WIKI_CACHE_PATH) as cache:
+        if key in cache:
+            return cache[key]
+
+    # Fetch without holding the lock so parallel lookups don't queue up
+    result = wikipedia_api.invoke(query)
+    with WIKI_CACHE_LOCK, shelve.open(WIKI_CACHE_PATH) as cache:
+        cache[key] = result
+    return result
+
+
 # Create agent with Wikipedia
 wiki_agent = create_agent(
     model=llm,
@@ -126,7 +157,7 @@ wiki_agent = create_agent(
 
 question = "Tom M. Mitchell is an American computer scientist. What book did he write?"
 print(f"[+] Question: {question}")
-print("-" * 80)
+print(DASH)
 
 result = wiki_agent.invoke({"messages": [{"role": "user", "content": question}]})
 
@@ -136,9 +167,9 @@ print(f"\n[+] Answer: {result['messages'][-1].content}\n")
 # EXAMPLE 3: CUSTOM DATE TOOL
 # ============================================================================
 
-print(separator(count=80))
+print(SEP)
 print("[+] EXAMPLE 3: CUSTOM TOOL - DATE FUNCTION")
-print(separator(count=80))
+print(SEP)
 
 
 @tool
@@ -160,7 +191,7 @@ full_agent = create_agent(
 )
 
 print("[+] Testing agent with date question:")
-print("-" * 80)
+print(DASH)
 
 result = full_agent.invoke(
     {"messages": [{"role": "user", "content": "What's the date today?"}]}
@@ -172,9 +203,9 @@ print(f"\n[+] Answer: {result['messages'][-1].content}\n")
 # EXAMPLE 4: STRUCTURED OUTPUT
 # ============================================================================
 
-print(separator(count=80))
+print(SEP)
 print("[+] EXAMPLE 4: STRUCTURED OUTPUT")
-print(separator(count=80))
+print(SEP)
 
 
 class ContactInfo(BaseModel):
@@ -188,7 +219,7 @@ class ContactInfo(BaseModel):
 structured_agent = create_agent(model=llm, tools=[], response_format=ContactInfo)
 
 print("Extracting structured contact info:")
-print("-" * 80)
+print(DASH)
 
 result = structured_agent.invoke(
     {
@@ -212,12 +243,12 @@ if contact:
 # EXAMPLE 5: STREAMING
 # ============================================================================
 
-print(separator(count=80))
+print(SEP)
 print("[+] EXAMPLE 5: STREAMING AGENT RESPONSES")
-print(separator(count=80))
+print(SEP)
 
 print("[+] Streaming agent response:")
-print("-" * 80)
+print(DASH)
 
 for chunk in full_agent.stream(
     {"messages": [{"role": "user", "content": "What is 15% of 850?"}]},
@@ -236,9 +267,9 @@ print()
 # EXAMPLE 6: PYTHON CODE EXECUTION (if you have langchain-experimental)
 # ============================================================================
 
-# print(separator(count=80))
+# print(SEP)
 # print("[+] EXAMPLE 6: PYTHON CODE EXECUTION (OPTIONAL)")
-# print(separator(count=80))
+# print(SEP)
 
 # try:
 #     from langchain_experimental.tools import PythonREPLTool
@@ -259,7 +290,7 @@ print()
 
 #     print("[+] Task: Sort customers by last name")
 #     print(f"[+] Input: {customer_list}")
-#     print("-" * 80)
+#     print(DASH)
 
 #     result = python_agent.invoke(
 #         {
@@ -281,9 +312,9 @@ print()
 # SUMMARY
 # ============================================================================
 
-print("=" * 80)
+print(SEP)
 print("SUMMARY - MODERN LANGCHAIN AGENTS (1.0+)")
-print("=" * 80 + "\n")
+print(SEP + "\n")
 
 print("""
 ✅ Key Points:
@@ -320,6 +351,6 @@ print("""
 The new API is simpler and more powerful!
 """)
 
-print("=" * 80)
+print(SEP)
 print("EXAMPLES COMPLETE")
-print("=" * 80)
+print(SEP)
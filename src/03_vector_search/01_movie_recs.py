@@ -38,14 +38,18 @@ except Exception as e:
 device = "mps" if torch.backends.mps.is_available() else "cpu"
 
 
+# Load the model once; re-instantiating it per call reloads the weights every time.
+_MODEL = SentenceTransformer(
+    "sentence-transformers/all-MiniLM-L6-v2", device=device, local_files_only=True
+)
+
+
 # GENERATE EMBEDDINGS
 def generate_embedding(text: str) -> list[float]:
     """Generate an embedding for a given text."""
-    model = SentenceTransformer(
-        "sentence-transformers/all-MiniLM-L6-v2", device=device, local_files_only=True
-    )
-
-    embeddings = model.encode(text)
+    # inference_mode skips autograd/version-counter bookkeeping (cheaper than no_grad)
+    with torch.inference_mode():
+        embeddings = _MODEL.encode(text, convert_to_numpy=True)
     # Convert NumPy array to list for BSON compatibility
     return embeddings.tolist()
 
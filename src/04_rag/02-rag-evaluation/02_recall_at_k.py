@@ -15,7 +15,7 @@ Example:
     - Recall@3 = 2/3 = 0.667
 """
 
-from rag_setup import setup_rag_pipeline, retrieve_documents
+from rag_setup import setup_rag_pipeline, retrieve_documents_batch
 from ground_truth import get_relevant_docs
 
 print("=" * 60)
@@ -83,10 +83,12 @@ test_queries = [
 
 K = 2
 
-for query in test_queries:
+# One batched encode and one vector-database query for all test queries
+all_retrieved = retrieve_documents_batch(test_queries, model, collection, k=5)
+
+for query, retrieved in zip(test_queries, all_retrieved):
     print(f"\nQuery: \"{query}\"")
     
-    retrieved = retrieve_documents(query, model, collection, k=5)
     relevant = get_relevant_docs(query)
     
     print(f"   Retrieved: {retrieved[:K]}")
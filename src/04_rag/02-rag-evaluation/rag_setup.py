@@ -11,6 +11,15 @@ This module contains shared components used across all evaluation tasks:
 Import this module in your task files to avoid code duplication.
 """
 
+import os
+import threading
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import count
+from pathlib import Path
+
+import numpy as np
+import torch
 import chromadb
 from sentence_transformers import SentenceTransformer
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -59,25 +68,184 @@ POLICY_DOCUMENTS = [
 CHUNK_SIZE = 200
 CHUNK_OVERLAP = 50
 EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+EMBED_CACHE_DIR = Path("~/.cache/rag_embeds").expanduser()
+QUERY_CACHE_SIZE = 4096
+SEMANTIC_CACHE_SIZE = 1024
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+
+# ============================================================================
+# IN-MEMORY INDEX
+# ============================================================================
+
+class InMemoryIndex:
+    """
+    Exact nearest-neighbour index over an in-process embedding matrix.
+    
+    Exposes the subset of the ChromaDB collection API used here (add, count,
+    query), so it can be swapped in for a collection. For a corpus of a few
+    dozen chunks a single matrix product beats walking an HNSW graph, and
+    there is no client or metadata serialisation per query.
+    
+    Optional: the evaluation scripts use the default ChromaDB backend; pass
+    backend="memory" to setup_rag_pipeline() to use this index instead.
+    """
+    
+    def __init__(self, name):
+        self.name = name
+        self.ids = []
+        self.documents = []
+        self.metadatas = []
+        self.embeddings = None
+    
+    def add(self, ids, documents, metadatas, embeddings):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        self.ids.extend(ids)
+        self.documents.extend(documents)
+        self.metadatas.extend(metadatas)
+        if self.embeddings is not None:
+            embeddings = np.vstack([self.embeddings, embeddings])
+        self.embeddings = embeddings
+    
+    def count(self):
+        return len(self.ids)
+    
+    def query(self, query_embeddings, n_results=10, include=("metadatas", "documents", "distances")):
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        n_results = min(n_results, self.count())
+        
+        if n_results == 0:
+            top = np.empty((len(queries), 0), dtype=np.intp)
+            similarities = np.empty((len(queries), 0), dtype=np.float32)
+        else:
+            # Embeddings are unit-normalised, so cosine similarity is a dot
+            # product: one GEMM scores every query against every chunk
+            scores = queries @ self.embeddings.T
+            top = np.argpartition(-scores, n_results - 1, axis=1)[:, :n_results]
+            similarities = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-similarities, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            similarities = np.take_along_axis(similarities, order, axis=1)
+        
+        results = {"ids": [[self.ids[i] for i in row] for row in top]}
+        if "metadatas" in include:
+            results["metadatas"] = [[self.metadatas[i] for i in row] for row in top]
+        if "documents" in include:
+            results["documents"] = [[self.documents[i] for i in row] for row in top]
+        if "distances" in include:
+            results["distances"] = (1 - similarities).tolist()
+        return results
+
+
+# ============================================================================
+# HNSW INDEX TUNING
+# ============================================================================
+
+def configure_hnsw_params(n_vectors):
+    """
+    Pick HNSW index parameters for the expected collection size.
+    
+    Small collections get a cheap graph; larger ones trade build time and
+    memory for recall.
+    
+    Args:
+        n_vectors: Number of vectors that will be stored
+    
+    Returns:
+        dict: ChromaDB collection metadata with the HNSW settings
+    """
+    if n_vectors < 100_000:
+        m, ef_construction, ef_search = 16, 64, 40
+    elif n_vectors < 1_000_000:
+        m, ef_construction, ef_search = 24, 100, 100
+    else:
+        m, ef_construction, ef_search = 32, 128, 200
+    
+    # Every embedding is unit-normalised at encode time (normalize_embeddings=True),
+    # so inner product ranks exactly like cosine without re-normalising both
+    # vectors at every candidate visit
+    return {
+        "hnsw:space": "ip",
+        "hnsw:M": m,
+        "hnsw:construction_ef": ef_construction,
+        "hnsw:search_ef": ef_search,
+        "hnsw:num_threads": os.cpu_count() or 1,
+    }
+
+
+# ============================================================================
+# EMBEDDING CACHE
+# ============================================================================
+
+def encode_documents(documents, model):
+    """
+    Embed documents, reusing embeddings cached on disk from earlier runs.
+    
+    Each chunk is keyed by a hash of the model name and its text, so only
+    new or changed chunks go through the transformer.
+    
+    Args:
+        documents: List of chunk texts
+        model: SentenceTransformer model
+    
+    Returns:
+        numpy.ndarray: One embedding row per document, in input order
+    """
+    EMBED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    paths = [
+        EMBED_CACHE_DIR / f"{blake2b((EMBEDDING_MODEL + doc).encode()).hexdigest()}.npy"
+        for doc in documents
+    ]
+    
+    embeddings = [np.load(path) if path.exists() else None for path in paths]
+    misses = [i for i, emb in enumerate(embeddings) if emb is None]
+    
+    if misses:
+        # Generate embeddings in large batches straight to an ndarray; Chroma
+        # accepts it as-is, so there is no per-float .tolist() round-trip.
+        # encode() already sorts inputs by length internally to minimise padding.
+        encoded = model.encode(
+            [documents[i] for i in misses],
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        for i, emb in zip(misses, encoded):
+            np.save(paths[i], emb)
+            embeddings[i] = emb
+    
+    print(f"  [OK] Embeddings: {len(documents) - len(misses)} cached, {len(misses)} computed")
+    return np.vstack(embeddings)
 
 
 # ============================================================================
 # RAG PIPELINE SETUP
 # ============================================================================
 
-def setup_rag_pipeline(collection_name="rag_eval_collection"):
+def setup_rag_pipeline(collection_name="rag_eval_collection", device=None, backend="chroma"):
     """
     Set up the complete RAG pipeline.
     
+    Args:
+        collection_name: Name of the ChromaDB collection to (re)create
+        device: Torch device for the embedding model; defaults to CUDA when
+            available, otherwise CPU
+        backend: "chroma" for a ChromaDB collection, or "memory" for an
+            InMemoryIndex that keeps ChromaDB off the query path
+    
     Returns:
-        tuple: (model, collection, chunks) - embedding model, ChromaDB collection, and chunks list
+        tuple: (model, collection, chunks) - embedding model, ChromaDB collection
+            (or InMemoryIndex), and list of (id, content, metadata) chunk tuples
     """
     print("Setting up RAG Pipeline...")
     
     # Step 1: Load embedding model FIRST
     print("  Loading embedding model...")
-    model = SentenceTransformer(EMBEDDING_MODEL)
-    print(f"  [OK] Loaded embedding model: {EMBEDDING_MODEL}")
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(EMBEDDING_MODEL, device=device)
+    print(f"  [OK] Loaded embedding model: {EMBEDDING_MODEL} ({device})")
     
     # Step 2: Chunk documents
     text_splitter = RecursiveCharacterTextSplitter(
@@ -87,41 +255,46 @@ def setup_rag_pipeline(collection_name="rag_eval_collection"):
         separators=["\n\n", "\n", " ", ""]
     )
     
-    all_chunks = []
-    for doc in POLICY_DOCUMENTS:
-        chunks = text_splitter.split_text(doc["content"])
-        for i, chunk in enumerate(chunks):
-            all_chunks.append({
-                "id": f"{doc['id']}_chunk_{i}",
-                "title": doc["title"],
-                "content": chunk,
-                "category": doc["category"],
-                "source_doc": doc["id"]
-            })
+    # Single pass straight into the parallel ids/documents/metadatas lists.
+    # Chunks get sequential integer IDs (stringified only for the vector
+    # database); _chunk_sources maps an ID back to its source document.
+    chunk_ids = count()
+    all_chunks = [
+        (
+            str(next(chunk_ids)),
+            chunk,
+            {"title": doc["title"], "category": doc["category"], "source": doc["id"]}
+        )
+        for doc in POLICY_DOCUMENTS
+        for chunk in text_splitter.split_text(doc["content"])
+    ]
+    ids, documents, metadatas = map(list, zip(*all_chunks))
+    _chunk_sources[:] = [metadata["source"] for metadata in metadatas]
     
     print(f"  [OK] Created {len(all_chunks)} chunks from {len(POLICY_DOCUMENTS)} documents")
     
     # Step 3: Set up vector database
-    client = chromadb.Client()
-    try:
-        collection = client.create_collection(
-            name=collection_name,
-            metadata={"hnsw:space": "cosine"}
-        )
-    except:
-        client.delete_collection(collection_name)
-        collection = client.create_collection(
-            name=collection_name,
-            metadata={"hnsw:space": "cosine"}
-        )
+    clear_semantic_cache(collection_name)
+    if backend == "memory":
+        collection = InMemoryIndex(collection_name)
+    else:
+        client = chromadb.Client()
+        hnsw_metadata = configure_hnsw_params(len(all_chunks))
+        try:
+            collection = client.create_collection(
+                name=collection_name,
+                metadata=hnsw_metadata
+            )
+        except:
+            client.delete_collection(collection_name)
+            collection = client.create_collection(
+                name=collection_name,
+                metadata=hnsw_metadata
+            )
     
     # Step 4: Store chunks with embeddings
-    ids = [chunk["id"] for chunk in all_chunks]
-    documents = [chunk["content"] for chunk in all_chunks]
-    metadatas = [{"title": chunk["title"], "category": chunk["category"], "source": chunk["source_doc"]} for chunk in all_chunks]
-    
-    # Generate embeddings
-    embeddings = model.encode(documents).tolist()
+    # Generate embeddings (cached on disk across runs)
+    embeddings = encode_documents(documents, model)
     
     collection.add(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
     print(f"  [OK] Stored {len(all_chunks)} chunks in vector database")
@@ -135,36 +308,152 @@ def setup_rag_pipeline(collection_name="rag_eval_collection"):
 # DOCUMENT RETRIEVAL
 # ============================================================================
 
-def retrieve_documents(query, model, collection, k=5):
+def embed_queries(queries, model):
     """
-    Retrieve top-K documents for a query.
+    Embed a batch of queries in a single encoder call.
     
     Args:
-        query: Search query string
+        queries: List of query strings
         model: SentenceTransformer model
-        collection: ChromaDB collection
-        k: Number of results to return
     
     Returns:
-        list: List of source document IDs (deduplicated, in order)
+        numpy.ndarray: One embedding row per query
+    """
+    return model.encode(
+        [query.lower().strip() for query in queries],
+        batch_size=8,
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    )
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _embed_query(query, model):
+    """Exact-match cache for single-query embeddings (stored as raw bytes)."""
+    return embed_queries([query], model)[0].astype(np.float32).tobytes()
+
+
+# Chunk ID -> source document ID, filled in by setup_rag_pipeline. Chunking
+# is deterministic, so every collection built from POLICY_DOCUMENTS shares it.
+_chunk_sources = []
+
+
+# Semantic cache: per (collection name, k), a FIFO ring of recent query
+# embeddings and the sources they retrieved. A new query whose embedding is
+# close enough to a cached one (a paraphrase) reuses those sources and skips
+# the vector database entirely.
+_semantic_cache = {}
+_semantic_cache_lock = threading.Lock()
+
+
+def clear_semantic_cache(collection_name):
+    """Drop cached results for a collection (e.g. after it is rebuilt)."""
+    with _semantic_cache_lock:
+        for key in [key for key in _semantic_cache if key[0] == collection_name]:
+            del _semantic_cache[key]
+
+
+def _semantic_cache_lookup(cache_key, query_embedding):
+    with _semantic_cache_lock:
+        entry = _semantic_cache.get(cache_key)
+        if entry is None:
+            return None
+        # Embeddings are unit-normalised, so one matrix-vector product gives
+        # the cosine similarity against every cached query
+        similarities = entry["embeddings"][:len(entry["sources"])] @ query_embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= SEMANTIC_CACHE_THRESHOLD:
+            return list(entry["sources"][best])
+    return None
+
+
+def _semantic_cache_store(cache_key, query_embedding, sources):
+    with _semantic_cache_lock:
+        entry = _semantic_cache.get(cache_key)
+        if entry is None:
+            entry = _semantic_cache[cache_key] = {
+                "embeddings": np.zeros((SEMANTIC_CACHE_SIZE, len(query_embedding)), dtype=np.float32),
+                "sources": [],
+                "next": 0,
+            }
+        slot = entry["next"]
+        entry["embeddings"][slot] = query_embedding
+        if slot < len(entry["sources"]):
+            entry["sources"][slot] = sources
+        else:
+            entry["sources"].append(sources)
+        entry["next"] = (slot + 1) % SEMANTIC_CACHE_SIZE
+
+
+def retrieve_documents_batch(queries, model, collection, k=5, query_embeddings=None):
+    """
+    Retrieve top-K documents for several queries at once.
+    
+    All queries are embedded in one encoder call and every query that misses
+    the semantic cache is sent to the vector database in a single request.
+    
+    Args:
+        queries: List of search query strings
+        model: SentenceTransformer model
+        collection: ChromaDB collection or InMemoryIndex
+        k: Number of results to return per query
+        query_embeddings: Optional pre-computed embeddings, one per query
+            (see embed_queries); when given, the queries are not re-encoded
+    
+    Returns:
+        list: One list of source document IDs (deduplicated, in order) per query
     """
-    query_embedding = model.encode(query.lower().strip())
+    if query_embeddings is None:
+        query_embeddings = embed_queries(queries, model)
+    
+    cache_key = (collection.name, k)
+    all_sources = [_semantic_cache_lookup(cache_key, emb) for emb in query_embeddings]
+    misses = [i for i, sources in enumerate(all_sources) if sources is None]
+    if not misses:
+        return all_sources
     
+    # IDs are always returned, and they are all we need to find the source
     results = collection.query(
-        query_embeddings=[query_embedding.tolist()],
-        n_results=k
+        query_embeddings=[query_embeddings[i].tolist() for i in misses],
+        n_results=k,
+        include=[]
     )
     
-    # Extract unique source document IDs in order of retrieval
-    retrieved_sources = []
-    seen = set()
-    for metadata in results['metadatas'][0]:
-        source = metadata['source']
-        if source not in seen:
-            retrieved_sources.append(source)
-            seen.add(source)
+    for i, chunk_ids in zip(misses, results['ids']):
+        # Extract unique source document IDs in order of retrieval
+        retrieved_sources = []
+        seen = set()
+        for chunk_id in chunk_ids:
+            source = _chunk_sources[int(chunk_id)]
+            if source not in seen:
+                retrieved_sources.append(source)
+                seen.add(source)
+        
+        _semantic_cache_store(cache_key, query_embeddings[i], tuple(retrieved_sources))
+        all_sources[i] = retrieved_sources
+    
+    return all_sources
+
+
+def retrieve_documents(query, model, collection, k=5, query_embedding=None):
+    """
+    Retrieve top-K documents for a query.
+    
+    Args:
+        query: Search query string
+        model: SentenceTransformer model
+        collection: ChromaDB collection or InMemoryIndex
+        k: Number of results to return
+        query_embedding: Optional pre-computed embedding (see embed_queries);
+            when given, the query is not re-encoded
+    
+    Returns:
+        list: List of source document IDs (deduplicated, in order)
+    """
+    if query_embedding is None:
+        query_embedding = np.frombuffer(_embed_query(query.lower().strip(), model), dtype=np.float32)
     
-    return retrieved_sources
+    return retrieve_documents_batch([query], model, collection, k, query_embeddings=[query_embedding])[0]
 
 
 # ============================================================================
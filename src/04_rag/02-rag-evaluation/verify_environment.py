@@ -7,6 +7,7 @@ Automatically installs missing packages and verifies the environment.
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Required packages for this lab
 REQUIRED_PACKAGES = [
@@ -16,6 +17,8 @@ REQUIRED_PACKAGES = [
     ("numpy", "numpy"),
 ]
 
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
 def check_python_version():
     """Check Python version"""
     version = sys.version_info
@@ -41,11 +44,20 @@ def check_virtual_env():
 
 def check_package_installed(import_name):
     """Check if a package can be imported"""
+    return try_import(import_name) is not None
+
+def try_import(import_name):
+    """Import a package, returning the module or None if it is missing"""
     try:
-        __import__(import_name.split('.')[0])
-        return True
+        return __import__(import_name.split('.')[0])
     except ImportError:
-        return False
+        return None
+
+def import_all(import_names):
+    """Import several packages concurrently (most of the time is disk I/O
+    and C-level module init, which overlaps across threads)"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return list(executor.map(try_import, import_names))
 
 def install_packages(packages):
     """Install packages using uv pip"""
@@ -96,14 +108,12 @@ def check_and_install_packages():
     missing_packages = []
     installed_packages = []
     
-    for package_name, import_name in REQUIRED_PACKAGES:
-        if check_package_installed(import_name):
-            try:
-                module = __import__(import_name.split('.')[0])
-                version = getattr(module, '__version__', 'installed')
-                print(f"  [OK] {package_name} (v{version})")
-            except:
-                print(f"  [OK] {package_name}")
+    modules = import_all([import_name for _, import_name in REQUIRED_PACKAGES])
+    
+    for (package_name, import_name), module in zip(REQUIRED_PACKAGES, modules):
+        if module is not None:
+            version = getattr(module, '__version__', 'installed')
+            print(f"  [OK] {package_name} (v{version})")
             installed_packages.append(package_name)
         else:
             print(f"  [X] {package_name} - MISSING")
@@ -150,12 +160,22 @@ def test_imports():
     
     all_good = True
     
-    for module, description in imports:
+    def _import(module):
         try:
             __import__(module)
-            print(f"  [OK] {description} ({module})")
+            return None
         except ImportError as e:
-            print(f"  [X] {description} ({module}): {e}")
+            return e
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        errors = list(executor.map(_import, [module for module, _ in imports]))
+    
+    # Report in a fixed order once every import has finished
+    for (module, description), error in zip(imports, errors):
+        if error is None:
+            print(f"  [OK] {description} ({module})")
+        else:
+            print(f"  [X] {description} ({module}): {error}")
             all_good = False
     
     return all_good
@@ -180,25 +200,41 @@ def test_evaluation_imports():
         return False
 
 
-def preload_embedding_model():
-    """Pre-download the embedding model to avoid timeout during tasks"""
+def load_embedding_model():
+    """Download/load the embedding model without printing.
+
+    Returns the embedding dimension; raises on failure. Safe to run in a
+    background thread.
+    """
+    from sentence_transformers import SentenceTransformer
+    
+    # This will download the model if not cached
+    model = SentenceTransformer(EMBEDDING_MODEL)
+    
+    # Quick test to ensure it works
+    test_embedding = model.encode("test query")
+    return len(test_embedding)
+
+def preload_embedding_model(model_future=None):
+    """Pre-download the embedding model to avoid timeout during tasks
+
+    If model_future is given, report on a load_embedding_model() call that
+    was started in the background instead of loading again.
+    """
     print("\nPre-loading Embedding Model:")
     print("   (This may take 1-2 minutes on first run...)")
+    print(f"  Downloading/loading {EMBEDDING_MODEL}...")
     
     try:
-        from sentence_transformers import SentenceTransformer
-        
-        model_name = 'all-MiniLM-L6-v2'
-        print(f"  Downloading/loading {model_name}...")
-        
-        # This will download the model if not cached
-        model = SentenceTransformer(model_name)
-        
-        # Quick test to ensure it works
-        test_embedding = model.encode("test query")
+        try:
+            dimension = model_future.result() if model_future else load_embedding_model()
+        except ImportError:
+            # sentence-transformers was only installed after the background
+            # load started; load again now that it is importable
+            dimension = load_embedding_model()
         
         print(f"  [OK] Model loaded successfully!")
-        print(f"  [OK] Embedding dimension: {len(test_embedding)}")
+        print(f"  [OK] Embedding dimension: {dimension}")
         
         return True
     except Exception as e:
@@ -222,6 +258,11 @@ def main():
         print("   Then run this script again.")
         sys.exit(1)
 
+    # Start the (slow, network-bound) model download now so it overlaps
+    # with the package and import checks below
+    model_executor = ThreadPoolExecutor(max_workers=1)
+    model_future = model_executor.submit(load_embedding_model)
+
     # Check Python version
     python_ok = check_python_version()
 
@@ -235,7 +276,8 @@ def main():
     eval_imports_ok = test_evaluation_imports()
 
     # Pre-load embedding model (critical for avoiding timeouts in tasks)
-    model_ok = preload_embedding_model()
+    model_ok = preload_embedding_model(model_future)
+    model_executor.shutdown()
 
     # Summary
     checks = {
@@ -69,6 +69,7 @@ import os
 import sys
 import logging
 import httpx
+from importlib.util import find_spec
 from dotenv import load_dotenv
 
 # Add src directory to Python path for imports
@@ -77,6 +78,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # LiveKit agent imports
 from livekit.agents import Agent, AgentSession, JobContext, WorkerOptions, cli
 from livekit.plugins import openai, elevenlabs, silero
+from openai import AsyncClient as OpenAIAsyncClient
+from utils.clear_screen import clear_screen
+from enums.ai_models import OpenAIModels
 from livekit.agents.metrics import LLMMetrics, STTMetrics, TTSMetrics, EOUMetrics
 import asyncio
 
@@ -86,14 +90,81 @@ logger = logging.getLogger("dlai-agent")
 
 # Load environment variables (LIVEKIT credentials, OPENAI API keys, etc.)
 load_dotenv()
-llm_model = os.getenv("OPENAI_MODEL", "openai/gpt-5-nano")
+llm_model = os.getenv("OPENAI_MODEL", OpenAIModels.gpt5_nano)
 requesty_api_key = os.getenv("REQUESTY_API_KEY")
-stt_model = os.getenv("STT_MODEL", "STT_MODEL=openai/gpt-4o-mini-transcribe")
+stt_model = os.getenv("STT_MODEL", OpenAIModels.stt_gpt_4o_mini_transcribe)
 
-os.system("clear")
+clear_screen()
 logger.log(logging.INFO, "Starting AGENT")
 
 
+def build_openai_client() -> OpenAIAsyncClient | None:
+    """Create the OpenAI SDK client shared by the LLM and STT plugins.
+
+    Both talk to the same Requesty endpoint, so they share one keep-alive
+    connection pool instead of each paying its own TCP+TLS handshake after
+    idle. The pool uses HTTP/2 when the `h2` package (httpx[http2]) is
+    installed and HTTP/1.1 otherwise. SDK retries are off: the LiveKit
+    plugins already retry through their connect options.
+    """
+    if not requesty_api_key:
+        return None
+    return OpenAIAsyncClient(
+        api_key=requesty_api_key,
+        base_url="https://router.requesty.ai/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(
+            http2=find_spec("h2") is not None,
+            follow_redirects=True,
+            timeout=httpx.Timeout(30.0, connect=15.0, read=30.0, write=10.0, pool=5.0),
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        ),
+    )
+
+
+def build_llm(client: OpenAIAsyncClient | None) -> openai.LLM | None:
+    """Initialize the LLM with Requesty's OpenAI-compatible API."""
+    # plugin factories may be None if imports failed; guard for that so module can be imported
+    if openai is None or client is None:
+        return None
+    try:
+        logger.info(f"Initializing LLM with model: {llm_model}")
+        llm = openai.LLM(model=llm_model, client=client)
+        logger.info("LLM initialized successfully")
+        return llm
+    except Exception as e:
+        logger.warning(f"Failed to initialize Requesty LLM: {e}")
+        return None
+
+
+def build_stt(client: OpenAIAsyncClient | None) -> openai.STT | None:
+    """Initialize the STT with Requesty's OpenAI-compatible API."""
+    if openai is None or client is None:
+        return None
+    try:
+        logger.info(f"Initializing STT with model: {stt_model}")
+        stt = openai.STT(model=stt_model, client=client)
+        logger.info("STT initialized successfully")
+        return stt
+    except Exception as e:
+        logger.warning(f"Failed to initialize Requesty STT: {e}")
+        return None
+
+
+def build_tts() -> elevenlabs.TTS | None:
+    """Initialize the TTS with ElevenLabs."""
+    # Roger: CwhRBWXzGAHq8TQ4Fs17
+    # Sarah: EXAVITQu4vr4xnSDxMaL
+    # Laura: FGY2WhTYpPnrIDTdsKH5
+    # George: JBFqnCBsd6RMkjVDRZzb
+    return elevenlabs.TTS() if elevenlabs is not None else None
+
+
+def build_vad() -> silero.VAD | None:
+    """Initialize the VAD with Silero (loads the model from disk)."""
+    return silero.VAD.load() if silero is not None else None
+
+
 class Assistant(Agent):
     """A simple LiveKit voice assistant wiring STT, LLM and TTS plugins.
 
@@ -104,53 +175,14 @@ class Assistant(Agent):
     Configure behavior via environment variables (e.g. OPENAI_MODEL).
     """
 
-    def __init__(self) -> None:
-        # plugin factories may be None if imports failed; guard for that so module can be imported
-
-        # Initialize LLM with Requesty's OpenAI-compatible API
-        llm: openai.LLM | None = None
-        if openai is not None and requesty_api_key:
-            try:
-                logger.info(f"Initializing LLM with model: {llm_model}")
-                llm = openai.LLM(
-                    model=llm_model,
-                    api_key=requesty_api_key,
-                    base_url="https://router.requesty.ai/v1",
-                    timeout=httpx.Timeout(
-                        30.0, connect=15.0, read=30.0, write=10.0, pool=5.0
-                    ),
-                )
-                logger.info("LLM initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Requesty LLM: {e}")
-                llm = None
-
-        # Initialize STT with Requesty's OpenAI-compatible API
-        stt: openai.STT | None = None
-        if openai is not None and requesty_api_key:
-            try:
-                logger.info(f"Initializing STT with model: {stt_model}")
-                stt = openai.STT(
-                    model=stt_model,
-                    api_key=requesty_api_key,
-                    base_url="https://router.requesty.ai/v1",
-                )
-                logger.info("STT initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Requesty STT: {e}")
-                stt = None
-
-        # Initialize TTS with ElevenLabs
-        """
-        # Roger: CwhRBWXzGAHq8TQ4Fs17
-        # Sarah: EXAVITQu4vr4xnSDxMaL
-        # Laura: FGY2WhTYpPnrIDTdsKH5
-        # George: JBFqnCBsd6RMkjVDRZzb
-        """
-        tts = elevenlabs.TTS() if elevenlabs is not None else None
-        # Initialize VAD with Silero
-        vad = silero.VAD.load() if silero is not None else None
-
+    def __init__(
+        self,
+        llm: openai.LLM | None,
+        stt: openai.STT | None,
+        tts: elevenlabs.TTS | None,
+        vad: silero.VAD | None,
+        client: OpenAIAsyncClient | None = None,
+    ) -> None:
         super().__init__(
             instructions="""
                 You are a helpful assistant communicating via voice.
@@ -170,26 +202,83 @@ class Assistant(Agent):
         assert tts is not None, "TTS not initialized"
         assert vad is not None, "VAD not initialized"
 
+        # Shared OpenAI client behind the LLM and STT; closed in on_exit()
+        self._client = client
+
+        # Metric events are queued and handled by one long-lived drainer task
+        # rather than spawning a new task per event
+        self._metrics_q: asyncio.Queue = asyncio.Queue()
+        self._drainer = asyncio.create_task(self._drain_metrics())
+
         def llm_metrics_wrapper(metrics: LLMMetrics):
-            asyncio.create_task(self.on_llm_metrics_collected(metrics))
+            self._metrics_q.put_nowait(("llm", metrics))
 
         llm.on("metrics_collected", llm_metrics_wrapper)
 
         def stt_metrics_wrapper(metrics: STTMetrics):
-            asyncio.create_task(self.on_stt_metrics_collected(metrics))
+            self._metrics_q.put_nowait(("stt", metrics))
 
         stt.on("metrics_collected", stt_metrics_wrapper)
 
         def eou_metrics_wrapper(metrics: EOUMetrics):
-            asyncio.create_task(self.on_eou_metrics_collected(metrics))
+            self._metrics_q.put_nowait(("eou", metrics))
 
         stt.on("eou_metrics_collected", eou_metrics_wrapper)
 
         def tts_metrics_wrapper(metrics: TTSMetrics):
-            asyncio.create_task(self.on_tts_metrics_collected(metrics))
+            self._metrics_q.put_nowait(("tts", metrics))
 
         tts.on("metrics_collected", tts_metrics_wrapper)
 
+    @classmethod
+    async def create(cls) -> "Assistant":
+        """Build the plugins concurrently in worker threads, then the agent.
+
+        The plugin constructors do blocking work (HTTP client setup, loading
+        the Silero model from disk); running them in parallel off the event
+        loop overlaps that start-up cost instead of paying it four times.
+        """
+        client = build_openai_client()
+        llm, stt, tts, vad = await asyncio.gather(
+            asyncio.to_thread(build_llm, client),
+            asyncio.to_thread(build_stt, client),
+            asyncio.to_thread(build_tts),
+            asyncio.to_thread(build_vad),
+        )
+        return cls(llm=llm, stt=stt, tts=tts, vad=vad, client=client)
+
+    async def _drain_metrics(self) -> None:
+        """Handle queued metric events, draining whatever has piled up per wake-up."""
+        handlers = {
+            "llm": self.on_llm_metrics_collected,
+            "stt": self.on_stt_metrics_collected,
+            "eou": self.on_eou_metrics_collected,
+            "tts": self.on_tts_metrics_collected,
+        }
+
+        async def handle(kind, metrics) -> None:
+            # One bad event (e.g. a metric that is None) must not kill the drainer
+            try:
+                await handlers[kind](metrics)
+            except Exception:
+                logger.exception("Failed to report %s metrics", kind)
+
+        while True:
+            kind, metrics = await self._metrics_q.get()
+            await handle(kind, metrics)
+            while not self._metrics_q.empty():
+                await handle(*self._metrics_q.get_nowait())
+
+    async def on_exit(self) -> None:
+        """Stop the metrics drainer and close the shared client on leaving."""
+        self._drainer.cancel()
+        try:
+            await self._drainer
+        except asyncio.CancelledError:
+            pass
+        if self._client is not None:
+            await self._client.close()
+
     async def on_llm_metrics_collected(self, metrics: LLMMetrics) -> None:
         print("\n--- LLM Metrics ---")
         print(f"Prompt Tokens: {metrics.prompt_tokens}")
@@ -230,7 +319,7 @@ async def entrypoint(ctx: JobContext):
     await ctx.connect()
 
     session = AgentSession()
-    await session.start(room=ctx.room, agent=Assistant())
+    await session.start(room=ctx.room, agent=await Assistant.create())
 
 
 def main():
@@ -1,84 +1,101 @@
 import os
 import sys
+import argparse
 from dotenv import load_dotenv
 
 # Add src directory to Python path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-import jsonlines
+import orjson
 import pandas as pd
 from pprint import pprint
 
 from utils.separator import separator  # type: ignore
+from utils.clear_screen import clear_screen  # type: ignore
 
 load_dotenv()
-os.system("clear")
+clear_screen()
+
+parser = argparse.ArgumentParser(description="Prepare the Lamini docs fine-tuning dataset")
+parser.add_argument(
+    "--tokenize-with",
+    metavar="MODEL",
+    help="Also pre-tokenize the prompts with this Hugging Face tokenizer and save them as parquet",
+)
+args = parser.parse_args()
+
+# Supported (question, answer) column layouts
+COLUMN_FORMATS = {
+    frozenset({"question", "answer"}): ("question", "answer"),
+    frozenset({"instruction", "response"}): ("instruction", "response"),
+    frozenset({"input", "output"}): ("input", "output"),
+}
+
+
+def _detect_columns(df: pd.DataFrame) -> tuple[str, str | None]:
+    """Return the (question, answer) column names; answer is None for text-only data."""
+    columns = set(df.columns)
+    for keys, pair in COLUMN_FORMATS.items():
+        if keys <= columns:
+            return pair
+    return "text", None
+
 
 # Load the dataset
 print("[+] Loading dataset...")
 filename = os.path.join(os.path.dirname(__file__), "data", "lamini_docs.jsonl")
-instruction_dataset_df = pd.read_json(filename, lines=True)
+# Arrow's multithreaded JSON reader is several times faster than the default
+# parser on JSONL (needs pandas >= 2.0 and pyarrow)
+instruction_dataset_df = pd.read_json(filename, lines=True, engine="pyarrow")
 print(instruction_dataset_df.head(10))
 
 print(separator(count=80))
-print("[+] Convert the DataFrame to a dictionary....")
-examples = instruction_dataset_df.to_dict()
-
-print("[+] Combine question and answer from dictionary...")
-if "question" in examples and "answer" in examples:
-    text = examples["question"][0] + examples["answer"][0]
-elif "instruction" in examples and "response" in examples:
-    text = examples["instruction"][0] + examples["response"][0]
-elif "input" in examples and "output" in examples:
-    text = examples["input"][0] + examples["output"][0]
-else:
-    text = examples["text"][0]
-
-text = examples["question"][0] + examples["answer"][0]
+QKEY, AKEY = _detect_columns(instruction_dataset_df)
+if AKEY is None:
+    raise ValueError(f"[-] Expected question/answer columns, got: {list(instruction_dataset_df.columns)}")
+
+print(f"[+] Extract the {QKEY!r} and {AKEY!r} columns....")
+# Raw column arrays: iterating these avoids a dict lookup plus a pandas
+# __getitem__ per field per example
+questions = instruction_dataset_df[QKEY].to_numpy()
+answers = instruction_dataset_df[AKEY].to_numpy()
+
+print("[+] Combine question and answer from the columns...")
+text = questions[0] + answers[0]
 print(text)
 
 
 print(separator(count=80))
 # PROMPT TEMPLATES
-prompt_template_qa = """### Question:
-{question}
+# Built by plain concatenation rather than str.format(), which re-parses the
+# template on every call:
+#   "### Question:\n{question}\n\n### Answer:\n{answer}"
+PREFIX_Q = "### Question:\n"
+MID_A = "\n\n### Answer:\n"
 
-### Answer:
-{answer}"""
+question = questions[0]
+answer = answers[0]
 
-question = examples["question"][0]
-answer = examples["answer"][0]
-
-text_with_prompt_template = prompt_template_qa.format(question=question, answer=answer)
+text_with_prompt_template = PREFIX_Q + question + MID_A + answer
 print("[+] Example Prompt...")
 print(text_with_prompt_template)
 
 print(separator(count=80))
-# PROMPT TEMPLATES
-prompt_template_q = """### Question:
-{question}
+# Question-only prompt: "### Question:\n{question}\n\n### Answer:"
+SUFFIX_Q = "\n\n### Answer:"
 
-### Answer:"""
-
-num_examples = len(examples["question"])
+num_examples = len(questions)
 print(f"[+] Number of examples: {num_examples}")
 print(separator(count=80))
 
-finetuning_dataset_text_only = []
-finetuning_dataset_question_answer = []
-for i in range(num_examples):
-    question = examples["question"][i]
-    answer = examples["answer"][i]
-
-    text_with_prompt_template_qa = prompt_template_qa.format(
-        question=question, answer=answer
-    )
-    finetuning_dataset_text_only.append({"text": text_with_prompt_template_qa})
-
-    text_with_prompt_template_q = prompt_template_q.format(question=question)
-    finetuning_dataset_question_answer.append(
-        {"question": text_with_prompt_template_q, "answer": answer}
-    )
+finetuning_dataset_text_only = [
+    {"text": PREFIX_Q + question + MID_A + answer}
+    for question, answer in zip(questions, answers)
+]
+finetuning_dataset_question_answer = [
+    {"question": PREFIX_Q + question + SUFFIX_Q, "answer": answer}
+    for question, answer in zip(questions, answers)
+]
 
 print("[+] Example of text only dataset...")
 pprint(finetuning_dataset_text_only[0])
@@ -92,18 +109,52 @@ print(separator(count=80))
 # Save the dataset
 print("[+] Saving the dataset...")
 
-with jsonlines.open(
-    (
-        os.path.join(
-            os.path.dirname(__file__), "data", "finetuning_dataset_text_only.jsonl"
-        )
+# orjson serialises straight to bytes in C; write every record in a single
+# buffered write instead of one json.dumps + write per record
+with open(
+    os.path.join(
+        os.path.dirname(__file__), "data", "finetuning_dataset_text_only.jsonl"
     ),
-    "w",
+    "wb",
+    buffering=1 << 20,
 ) as writer:
-    writer.write_all(finetuning_dataset_question_answer)
+    writer.write(
+        b"\n".join(orjson.dumps(record) for record in finetuning_dataset_question_answer)
+        + b"\n"
+    )
 
 print("[+] Dataset saved!")
 
+# Pre-tokenize once so fine-tuning doesn't re-tokenize the same prompts every epoch
+if args.tokenize_with:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from transformers import AutoTokenizer
+
+    print(separator(count=80))
+    print(f"[+] Tokenizing prompts with {args.tokenize_with}...")
+    tokenizer = AutoTokenizer.from_pretrained(args.tokenize_with)
+    tokenized = tokenizer(
+        [record["text"] for record in finetuning_dataset_text_only],
+        padding=False,
+        truncation=True,
+        return_tensors=None,
+    )
+
+    table = pa.table(
+        {
+            "input_ids": pa.array(tokenized["input_ids"], type=pa.list_(pa.int32())),
+            "attention_mask": pa.array(
+                tokenized["attention_mask"], type=pa.list_(pa.int8())
+            ),
+        }
+    )
+    tokenized_path = os.path.join(
+        os.path.dirname(__file__), "data", "finetuning_dataset_tokenized.parquet"
+    )
+    pq.write_table(table, tokenized_path)
+    print(f"[+] Tokenized dataset saved: {tokenized_path}")
+
 # finetuning_dataset_name = "lamini/lamini_docs"
 # finetuning_dataset = load_dataset(finetuning_dataset_name)
 # print(finetuning_dataset)
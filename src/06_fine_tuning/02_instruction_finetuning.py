@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 
 import itertools
 import jsonlines
+import torch
 
 # import pandas as pd
 from pprint import pprint
@@ -26,12 +27,6 @@ instruction_tuned_dataset = load_dataset(
 )
 
 m = 5
-print("Instruction-tuned dataset:")
-top_m = list(itertools.islice(instruction_tuned_dataset, m))
-for j in top_m:
-    print(j)
-
-print(separator(count=80))
 
 # 2 PROMPT TEMPLATES
 prompt_template_with_input = """Below is an instruction that describes a task, paired with an input that provides further context. Write a response that appropriately completes the request.
@@ -51,35 +46,43 @@ prompt_template_without_input = """Below is an instruction that describes a task
 
 ### Response:"""
 
-# HYDRATE PROMPTS (Add data to prompts)
-print("[+] Hydrating prompts...")
-processed_data = []
-for j in top_m:
-    if not j["input"]:
-        processed_prompt = prompt_template_without_input.format(
-            instruction=j["instruction"]
-        )
-    else:
-        processed_prompt = prompt_template_with_input.format(
-            instruction=j["instruction"], input=j["input"]
-        )
+# Indexed by bool(row["input"])
+prompt_templates = (prompt_template_without_input, prompt_template_with_input)
 
-    processed_data.append({"input": processed_prompt, "output": j["output"]})
 
-print("[+] Example of processed data...")
-pprint(processed_data[0])
+def build_prompts(stream, n, writer):
+    """Hydrate prompts for the first n rows of the stream and write them out.
 
-print(separator(count=80))
+    Single streaming pass: each row is printed, formatted and written as it
+    arrives, with no intermediate list. Returns the first processed record.
+    """
+    first = None
+    for j in itertools.islice(stream, n):
+        print(j)
+        record = {
+            "input": prompt_templates[bool(j["input"])].format_map(j),
+            "output": j["output"],
+        }
+        writer.write(record)
+        if first is None:
+            first = record
+    return first
 
-# Save the dataset
-print("[+] Saving the dataset...")
+
+# HYDRATE PROMPTS (Add data to prompts) and save the dataset
+print("[+] Hydrating prompts and saving the dataset...")
+print("Instruction-tuned dataset:")
 with jsonlines.open(
     f"{os.path.dirname(__file__)}/data/alpaca_processed.jsonl", "w"
 ) as writer:
-    writer.write_all(processed_data)
+    first_processed = build_prompts(instruction_tuned_dataset, m, writer)
 
 print("[+] Dataset saved!")
 
+print(separator(count=80))
+print("[+] Example of processed data...")
+pprint(first_processed)
+
 print(separator(count=80))
 # Compare non-instruction tuned vs instruction tuned models
 print("[+] Comparing non-instruction tuned and instruction tuned models...")
@@ -99,32 +102,76 @@ print("Instruction-tuned output (Llama 2): ", instruct_output)
 
 print(separator(count=80))
 
+
+def enable_static_cache(model, max_output_tokens=100):
+    """Pre-allocate the KV cache, and on CUDA compile the forward pass for decoding.
+
+    With a static cache, generate() allocates fixed-shape key/value buffers
+    up front. On a GPU that lets torch.compile capture the decode step as a
+    CUDA graph ("reduce-overhead"); the first generate() call pays the
+    compile, later calls reuse it. On CPU the static cache runs eagerly.
+    """
+    model.generation_config.cache_implementation = "static"
+    model.generation_config.max_new_tokens = max_output_tokens
+    if model.device.type == "cuda":
+        model.forward = torch.compile(
+            model.forward, mode="reduce-overhead", fullgraph=True
+        )
+    return model
+
+
+# Half-precision weights halve the bytes moved per decoded token; bf16 where the
+# GPU supports it, fp16 on other GPUs, fp32 on CPU (no fast half kernels there)
+if torch.cuda.is_available():
+    model_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+else:
+    model_dtype = torch.float32
+
+
+def load_causal_lm(model_name):
+    """Load a causal LM in model_dtype with fused scaled-dot-product attention."""
+    return AutoModelForCausalLM.from_pretrained(
+        model_name,
+        torch_dtype=model_dtype,
+        attn_implementation="sdpa",
+        device_map="auto",
+    )
+
+
 # Try Smaller Models
 tokenizer = AutoTokenizer.from_pretrained("EleutherAI/pythia-70m")
-model = AutoModelForCausalLM.from_pretrained("EleutherAI/pythia-70m")
+model = enable_static_cache(load_causal_lm("EleutherAI/pythia-70m"))
+
 
+def inference(
+    texts: list[str], model, tokenizer, max_input_tokens=1000, max_output_tokens=100
+) -> list[str]:
+    """Generate completions for a batch of prompts with one generate() call."""
+    # Decoder-only models continue from the right, so pad prompts on the left
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "left"
 
-def inference(text, model, tokenizer, max_input_tokens=1000, max_output_tokens=100):
     # Tokenize
-    input_ids = tokenizer.encode(
-        text, return_tensors="pt", truncation=True, max_length=max_input_tokens
-    )
+    enc = tokenizer(
+        texts,
+        return_tensors="pt",
+        padding=True,
+        truncation=True,
+        max_length=max_input_tokens,
+    ).to(model.device)
 
     # Generate
-    device = model.device
     generated_tokens_with_prompt = model.generate(
-        input_ids=input_ids.to(device), max_length=max_output_tokens
+        **enc,
+        max_new_tokens=max_output_tokens,
+        use_cache=True,
+        pad_token_id=tokenizer.pad_token_id,
     )
 
-    # Decode
-    generated_text_with_prompt = tokenizer.batch_decode(
-        generated_tokens_with_prompt, skip_special_tokens=True
-    )
-
-    # Strip the prompt
-    generated_text_answer = generated_text_with_prompt[0][len(text) :]
-
-    return generated_text_answer
+    # Strip the prompt (in token space) and decode
+    generated_tokens = generated_tokens_with_prompt[:, enc.input_ids.shape[1] :]
+    return tokenizer.batch_decode(generated_tokens, skip_special_tokens=True)
 
 
 finetuning_dataset_path = "lamini/lamini_docs"
@@ -136,12 +183,12 @@ print(separator(count=80))
 test_sample = finetuning_dataset["test"][0]
 print(test_sample)
 
-print(inference(test_sample["question"], model, tokenizer))
+print(inference([test_sample["question"]], model, tokenizer)[0])
 
 print(separator(count=80))
 
-instruction_model = AutoModelForCausalLM.from_pretrained("lamini/lamini_docs_finetuned")
-print(inference(test_sample["question"], instruction_model, tokenizer))
+instruction_model = enable_static_cache(load_causal_lm("lamini/lamini_docs_finetuned"))
+print(inference([test_sample["question"]], instruction_model, tokenizer)[0])
 
 print(separator(count=80))
 
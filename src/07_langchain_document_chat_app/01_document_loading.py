@@ -7,6 +7,7 @@
 
 import os
 import sys
+import asyncio
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
@@ -22,7 +23,6 @@ from langchain_community.document_loaders.blob_loaders.file_system import (
     FileSystemBlobLoader,
 )
 from langchain_community.document_loaders.parsers import OpenAIWhisperParser
-from langchain_community.document_loaders.generic import GenericLoader
 
 from pydantic import SecretStr
 
@@ -69,21 +69,41 @@ def load_pdf_document():
 ##########################################################################
 # Document Loader, load Youtube Videos
 ##########################################################################
+async def transcribe_blobs(blob_loader, parser, max_concurrency=4):
+    """Transcribe audio blobs concurrently.
+
+    Each blob is handed to the (blocking) Whisper parser in a worker thread
+    as soon as the loader yields it, so downloads and transcriptions overlap
+    instead of running one after another.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def transcribe(blob):
+        async with semaphore:
+            return await asyncio.to_thread(lambda: list(parser.lazy_parse(blob)))
+
+    blobs = iter(blob_loader.yield_blobs())
+    tasks = []
+    while (blob := await asyncio.to_thread(next, blobs, None)) is not None:
+        tasks.append(asyncio.create_task(transcribe(blob)))
+
+    results = await asyncio.gather(*tasks)
+    return [doc for blob_docs in results for doc in blob_docs]
+
+
 def load_youtube_video():
     video_url = "https://www.youtube.com/shorts/G8nQJ4R0KwA"
     # video_url = "https://www.youtube.com/watch?v=wx2Ml3vWHys"
     save_dir = os.path.join(os.path.dirname(__file__), "docs", "youtube")
-    loader = GenericLoader(
-        YoutubeAudioLoader([video_url], save_dir),
-        # FileSystemBlobLoader(save_dir, glob="*.m4a"),  # fetch locally
-        OpenAIWhisperParser(
-            api_key=requesty_api_key.get_secret_value(),
-            base_url="https://router.requesty.ai/v1",
-            # model="openai/whisper-1",
-            model=OpenAIModels.stt_gpt_4o_mini_transcribe,
-        ),
+    blob_loader = YoutubeAudioLoader([video_url], save_dir)
+    # blob_loader = FileSystemBlobLoader(save_dir, glob="*.m4a")  # fetch locally
+    parser = OpenAIWhisperParser(
+        api_key=requesty_api_key.get_secret_value(),
+        base_url="https://router.requesty.ai/v1",
+        # model="openai/whisper-1",
+        model=OpenAIModels.stt_gpt_4o_mini_transcribe,
     )
-    docs = loader.load()
+    docs = asyncio.run(transcribe_blobs(blob_loader, parser))
     print(f"[+] Number of documents: {len(docs)}")
     print(separator(count=80))
     if docs:
@@ -9,6 +9,8 @@
 
 import os
 import sys
+import functools
+import tiktoken
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
@@ -144,14 +146,30 @@ filepath = os.path.join(
     "cs229_lectures",
     "MachineLearning-Lecture01.pdf",
 )
-loader = PyPDFLoader(filepath)
-pages = loader.load()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pages():
+    # Parse the PDF lazily, once per process, instead of at import time
+    return PyPDFLoader(filepath).load()
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    # o200k_base is the gpt-4o / gpt-5 tokenizer; load its vocab once
+    return tiktoken.get_encoding("o200k_base")
+
+
+def token_length(text):
+    return len(_encoding().encode(text, disallowed_special=()))
 
 
 def pdf_chunking():
     print("[+] PDF Splitter\n")
+    pages = _load_pages()
+    # Measure chunks in tokens rather than characters (~4 characters per token)
     text_splitter = CharacterTextSplitter(
-        chunk_size=1000, chunk_overlap=150, separator="\n", length_function=len
+        chunk_size=250, chunk_overlap=40, separator="\n", length_function=token_length
     )
     docs = text_splitter.split_documents(pages)
     print(f"[+] Number of documents: {len(docs)}")
@@ -167,17 +185,17 @@ def pdf_chunking():
 # This can be useful because LLMs often have context windows designated in tokens.
 # Tokens are often ~4 characters.
 ##########################################################################
-print("[+] TokenTextSplitter\n")
 
 
 def tokentext_splitting():
+    print("[+] TokenTextSplitter\n")
     text_splitter = TokenTextSplitter(chunk_size=1, chunk_overlap=0)
     text1 = "foo bar bazzyfoo"
     print(text_splitter.split_text(text1))
     print(separator(count=80))
 
     text_splitter = TokenTextSplitter(chunk_size=10, chunk_overlap=0)
-    docs = text_splitter.split_documents(pages)
+    docs = text_splitter.split_documents(_load_pages())
     print(f"[+] Number of documents: {len(docs)}")
     print(docs[0])
     print(separator(count=80))
@@ -187,10 +205,10 @@ def tokentext_splitting():
 ##########################################################################
 # MarkdownHeaderTextSplitter
 ##########################################################################
-print("[+] MarkdownHeaderTextSplitter\n")
 
 
 def markdown_header_splitting():
+    print("[+] MarkdownHeaderTextSplitter\n")
     markdown_document = """# Title\n\n \
 ## Chapter 1\n\n \
 Hi this is Jim\n\n Hi this is Joe\n\n \
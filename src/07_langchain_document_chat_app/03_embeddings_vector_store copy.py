@@ -1,9 +1,11 @@
 import os
 import sys
+import functools
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
 
 from pydantic import SecretStr
 import numpy as np
@@ -35,7 +37,9 @@ assert embeddings is not None, "OpenAI Embeddings not initialized"
 persist_directory = os.path.join(os.path.dirname(__file__), "docs", "chroma")
 
 vectordb = Chroma(persist_directory=persist_directory, embedding_function=embeddings)
-print(f"[+] Total documents in vector store: {vectordb._collection.count()}")
+
+if __debug__:
+    print(f"[+] Total documents in vector store: {vectordb._collection.count()}")
 
 ##########################################################################
 # Vector Retrieval
@@ -47,6 +51,47 @@ print(f"[+] Total documents in vector store: {vectordb._collection.count()}")
 ##########################################################################
 
 
+def normalize(vectors) -> np.ndarray:
+    """Stack embeddings into a float32 array with unit-length rows."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def mmr(query_embedding, doc_embeddings, k, fetch_k, lambda_mult=0.5) -> np.ndarray:
+    """Maximal marginal relevance over unit-normalised embeddings.
+
+    Returns the row indices of the k selected documents. Each pick maximises
+    lambda_mult * sim(query, doc) - (1 - lambda_mult) * max sim(doc, picked).
+    """
+    sims = doc_embeddings @ query_embedding
+    fetch_k = min(fetch_k, len(sims))
+    candidates = np.argpartition(-sims, fetch_k - 1)[:fetch_k]
+    candidate_sims = sims[candidates]
+    candidate_embeddings = doc_embeddings[candidates]
+
+    # First pick is the most relevant; after that, trade relevance for diversity
+    selected = [int(np.argmax(candidate_sims))]
+    max_sim = candidate_embeddings @ candidate_embeddings[selected[0]]
+    while len(selected) < min(k, fetch_k):
+        scores = lambda_mult * candidate_sims - (1 - lambda_mult) * max_sim
+        scores[selected] = -np.inf
+        i = int(np.argmax(scores))
+        selected.append(i)
+        max_sim = np.maximum(max_sim, candidate_embeddings @ candidate_embeddings[i])
+    return candidates[selected]
+
+
+@functools.lru_cache(maxsize=1)
+def load_store_matrix() -> tuple[np.ndarray, list[Document]]:
+    """Pull every stored embedding once as a normalised matrix, with its Document."""
+    stored = vectordb._collection.get(include=["embeddings", "documents", "metadatas"])
+    store_docs = [
+        Document(page_content=text, metadata=metadata or {})
+        for text, metadata in zip(stored["documents"], stored["metadatas"])
+    ]
+    return normalize(stored["embeddings"]), store_docs
+
+
 def mmr_search():
 
     texts = [
@@ -55,15 +100,21 @@ def mmr_search():
         """A. phalloides, a.k.a Death Cap, is one of the most poisonous of all known mushrooms.""",
     ]
 
-    smalldb = Chroma.from_texts(texts, embedding=embeddings)
+    # Three texts don't need a vector store: embed once, normalise, and
+    # search with a single matrix-vector product
+    smalldb = normalize(embeddings.embed_documents(texts))
 
     question = "Tell me about all-white mushrooms with large fruiting bodies"
     print(f"Question: {question}\n")
+    query_embedding = normalize(embeddings.embed_query(question))
 
-    print(smalldb.similarity_search(question, k=2))
+    scores = smalldb @ query_embedding
+    top_k = np.argpartition(-scores, 1)[:2]
+    top_k = top_k[np.argsort(-scores[top_k])]
+    print([texts[i] for i in top_k])
     print(separator(count=80))
 
-    print(smalldb.max_marginal_relevance_search(question, k=2, fetch_k=3))
+    print([texts[i] for i in mmr(query_embedding, smalldb, k=2, fetch_k=3)])
     print(separator(count=80))
 
     question = "what did they say about matlab?"
@@ -76,7 +127,11 @@ def mmr_search():
     print(docs_ss[1].page_content[:100])
     print(separator(count=80))
 
-    docs_mmr = vectordb.max_marginal_relevance_search(question, k=3)
+    # Same defaults as Chroma's MMR (fetch_k=20), but the scoring is two
+    # BLAS calls per pick instead of a pairwise Python loop
+    store_matrix, store_docs = load_store_matrix()
+    picked = mmr(normalize(embeddings.embed_query(question)), store_matrix, k=3, fetch_k=20)
+    docs_mmr = [store_docs[i] for i in picked]
     print(f"[+] MMR: Found {len(docs_mmr)} similar documents\n")
     print(docs_mmr[0].page_content[:100])
     print(separator(count=80))
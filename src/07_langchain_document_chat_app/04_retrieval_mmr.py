@@ -1,10 +1,15 @@
 import os
 import sys
+import asyncio
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader
+from langchain_community.document_loaders.parsers import PyPDFParser
+from langchain_core.documents.base import Blob
 from langchain_chroma import Chroma
 
 from pydantic import SecretStr
@@ -41,10 +46,24 @@ files = [
     "MachineLearning-Lecture03.pdf",
 ]
 
-loaders = [PyPDFLoader(os.path.join(filepath, file)) for file in files]
-docs = []
-for loader in loaders:
-    docs.extend(loader.load())
+# One parser shared by every load (this is what PyPDFLoader wraps per file)
+pdf_parser = PyPDFParser()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_pdf(path, mtime_ns):
+    return pdf_parser.parse(Blob.from_path(path))
+
+
+def load_pdf(path):
+    """Parse a PDF into page Documents, cached until the file is modified."""
+    return _parse_pdf(path, os.stat(path).st_mtime_ns)
+
+
+# Load the PDFs concurrently so file reads and parsing overlap
+with ThreadPoolExecutor(max_workers=len(files)) as executor:
+    loaded = executor.map(lambda file: load_pdf(os.path.join(filepath, file)), files)
+    docs = [doc for file_docs in loaded for doc in file_docs]
 
 print(f"[+] Number of documents: {len(docs)}")
 print(separator(count=80))
@@ -67,33 +86,78 @@ def embeddings_openai():
     sentence2 = "i like canines"
     sentence3 = "the weather is ugly outside"
 
-    embedding1 = embeddings.embed_query(sentence1)
-    embedding2 = embeddings.embed_query(sentence2)
-    embedding3 = embeddings.embed_query(sentence3)
+    # One request for all three sentences instead of one round trip each
+    embs = np.asarray(
+        embeddings.embed_documents([sentence1, sentence2, sentence3]),
+        dtype=np.float32,
+    )
+    # Normalise once so a single float32 GEMM yields every pairwise cosine similarity
+    embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+    sims = embs @ embs.T
 
-    print(np.dot(embedding1, embedding2))
+    print(sims[0, 1])
     print(separator(count=80))
-    print(np.dot(embedding1, embedding3))
+    print(sims[0, 2])
     print(separator(count=80))
-    print(np.dot(embedding2, embedding3))
+    print(sims[1, 2])
     print(separator(count=80))
 
 
 ##########################################################################
 # Vector Embeddings
 ##########################################################################
+async def embed_all(texts, batch_size=64, concurrency=8):
+    """Embed texts in batches, with up to `concurrency` requests in flight."""
+    assert embeddings is not None, "OpenAI Embeddings not initialized"
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def embed_batch(batch):
+        async with semaphore:
+            return await embeddings.aembed_documents(batch)
+
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+    return [vector for batch in results for vector in batch]
+
+
 def vector_embeddings():
     print("[+] Vector Embeddings\n")
     assert embeddings is not None, "OpenAI Embeddings not initialized"
 
-    # Remove the collection if it exists
+    # Reuse the persisted collection and only embed splits it doesn't have yet.
+    # To rebuild from scratch, remove the collection:
     # rm -r ./src/07_langchain_chat_app/docs/chroma
     persist_directory = os.path.join(os.path.dirname(__file__), "docs", "chroma")
 
-    vectordb = Chroma.from_documents(
-        documents=splits,
-        embedding=embeddings,
-        persist_directory=persist_directory,
+    vectordb = Chroma(
+        persist_directory=persist_directory, embedding_function=embeddings
+    )
+    # Content-hashed IDs: an unchanged chunk keeps its ID across runs (and
+    # across edits elsewhere in the PDFs), so only new/changed chunks are embedded
+    split_ids = {
+        hashlib.blake2b(split.page_content.encode(), digest_size=16).hexdigest(): split
+        for split in splits
+    }
+    stored_ids = set(vectordb.get(include=[])["ids"])
+    # Drop rows no current split hashes to: chunks whose text was edited, and
+    # rows stored under the older random UUID ids
+    stale_ids = stored_ids - split_ids.keys()
+    if stale_ids:
+        vectordb.delete(ids=list(stale_ids))
+    existing_ids = stored_ids & split_ids.keys()
+    new_ids = [split_id for split_id in split_ids if split_id not in existing_ids]
+    if new_ids:
+        new_splits = [split_ids[i] for i in new_ids]
+        texts = [split.page_content for split in new_splits]
+        vectordb._collection.add(
+            ids=new_ids,
+            embeddings=asyncio.run(embed_all(texts)),
+            documents=texts,
+            metadatas=[split.metadata for split in new_splits],
+        )
+    print(
+        f"[+] Embedded {len(new_ids)} new chunks, reused {len(existing_ids)}, "
+        f"removed {len(stale_ids)} stale"
     )
 
     print(f"[+] Total documents in vector store: {vectordb._collection.count()}")
@@ -5,10 +5,10 @@ from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
 from langchain_core.output_parsers import StrOutputParser
 
-from pydantic import SecretStr
+from pydantic import PrivateAttr, SecretStr
 
 # Add src directory to Python path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -25,9 +25,25 @@ api_key = os.getenv("REQUESTY_API_KEY")
 if not api_key:
     raise ValueError("REQUESTY_API_KEY not found in environment variables.")
 requesty_api_key: SecretStr = SecretStr(api_key)
+
+
+class CachedQueryEmbeddings(OpenAIEmbeddings):
+    """OpenAIEmbeddings that only calls the API once per distinct question."""
+
+    _query_cache: dict[tuple[str, str], tuple[float, ...]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def embed_query(self, text: str) -> list[float]:
+        key = (self.model, text)
+        if key not in self._query_cache:
+            self._query_cache[key] = tuple(super().embed_query(text))
+        return list(self._query_cache[key])
+
+
 llm: ChatOpenAI | None = None
 embeddings: OpenAIEmbeddings | None = None
-embeddings = OpenAIEmbeddings(
+embeddings = CachedQueryEmbeddings(
     api_key=requesty_api_key,
     base_url="https://router.requesty.ai/v1",
     model=OpenAIModels.text_embedding_3_small,
@@ -38,6 +54,7 @@ llm = ChatOpenAI(
     base_url="https://router.requesty.ai/v1",
     model=OpenAIModels.gpt5_nano,
     temperature=0,
+    streaming=True,
 )
 assert embeddings is not None, "OpenAI Embeddings not initialized"
 assert llm is not None, "Chat model not initialized"
@@ -45,7 +62,9 @@ assert llm is not None, "Chat model not initialized"
 persist_directory = os.path.join(os.path.dirname(__file__), "docs", "chroma")
 
 vectordb = Chroma(persist_directory=persist_directory, embedding_function=embeddings)
-print(f"[+] Total documents in vector store: {vectordb._collection.count()}")
+
+if __debug__:
+    print(f"[+] Total documents in vector store: {vectordb._collection.count()}")
 
 question = "What are major topics for this class?"
 print(f"[+] Question: {question}\n")
@@ -57,12 +76,11 @@ def qna_chatbot():
     print("[+] Q&A Chatbot\n")
     assert llm is not None, "Chat model not initialized"
 
-    retriever = vectordb.as_retriever()
-
     question = "What are major topics for this class?"
     print(f"[+] Question: {question}\n")
 
-    docs = vectordb.similarity_search(question, k=3)
+    # k=4 matches the retriever this chain used to call
+    docs = vectordb.similarity_search(question, k=4)
     print(f"[+] Found {len(docs)} similar documents\n")
 
     prompt_template = ChatPromptTemplate.from_template(
@@ -73,14 +91,21 @@ def qna_chatbot():
     def format_docs(docs):
         return "\n\n".join(doc.page_content for doc in docs)
 
-    # Create the LCEL chain
+    # Create the LCEL chain, feeding it the docs already retrieved above
+    # instead of running the retriever a second time
     chain = (
-        {"context": retriever | format_docs, "question": RunnablePassthrough()}
+        {
+            "context": RunnableLambda(lambda _: format_docs(docs)),
+            "question": RunnablePassthrough(),
+        }
         | prompt_template
         | llm
         | StrOutputParser()
     )
-    print(chain.invoke(question))
+    # Print tokens as they arrive rather than waiting for the whole answer
+    for chunk in chain.stream(question):
+        print(chunk, end="", flush=True)
+    print()
     print(separator(count=80))
 
 
@@ -1,8 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi_mcp import FastApiMCP
 
 # Create a FastAPI app
-app = FastAPI(title="Calculator MCP Server", version="0.1.0")
+# ORJSONResponse: serialising the reply is most of the work for these endpoints
+app = FastAPI(
+    title="Calculator MCP Server",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 
 @app.post("/multiply")
@@ -47,4 +53,14 @@ if __name__ == "__main__":
     print("[+] Visit http://localhost:8080/docs for API documentation")
 
     # uvicorn.run(app, host="0.0.0.0", port=8080)
-    uvicorn.run(app, host="localhost", port=8080)
+    # uvicorn's "auto" loop/http already pick uvloop and httptools when
+    # uvicorn[standard] is installed, falling back to asyncio and h11.
+    # A single worker: mount_http() keeps MCP sessions in process memory, so a
+    # request carrying an Mcp-Session-Id must reach the process that issued it
+    uvicorn.run(
+        app,
+        host="localhost",
+        port=8080,
+        log_level="warning",
+        access_log=False,
+    )
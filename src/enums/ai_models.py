@@ -1,39 +1,51 @@
 """
-This module defines enums for OpenAI model names used in the API.
+This module defines constants for OpenAI model names used in the API.
 """
 
-from enum import Enum
+from types import MappingProxyType
+from typing import Final, Mapping
 
 
-class OpenAIModels(str, Enum):
+class OpenAIModels:
     """
-    Enum for OpenAI model names.
+    OpenAI model names, as plain string constants.
     """
 
-    gpt4o = "openai/gpt-4o"
-    """
-    GPT-4.0 model identifier for OpenAI API.
-    """
+    # GPT-4.0 model identifier for OpenAI API.
+    gpt4o: Final[str] = "openai/gpt-4o"
 
-    gpt4_1 = "openai/gpt-4.1"
-    """
-    GPT-4.1 model identifier for OpenAI API.
-    """
+    # GPT-4.1 model identifier for OpenAI API.
+    gpt4_1: Final[str] = "openai/gpt-4.1"
 
-    gpt5_nano = "openai/gpt-5-nano"
-    """
-    GPT-5-Nano model identifier for OpenAI API.
-    """
+    # GPT-5-Nano model identifier for OpenAI API.
+    gpt5_nano: Final[str] = "openai/gpt-5-nano"
 
-    text_embedding_3_small = "openai/text-embedding-3-small"
-    """
-    Text Embedding 3 Small model identifier for OpenAI API.
-    """
+    # Text Embedding 3 Small model identifier for OpenAI API.
+    text_embedding_3_small: Final[str] = "openai/text-embedding-3-small"
 
-    stt_gpt_4o_mini_transcribe = "openai/gpt-4o-mini-transcribe"
-    """
-    GPT-4o-Mini-Transcribe model identifier for OpenAI API.
-    """
+    # GPT-4o-Mini-Transcribe model identifier for OpenAI API.
+    stt_gpt_4o_mini_transcribe: Final[str] = "openai/gpt-4o-mini-transcribe"
+
+    @classmethod
+    def from_value(cls, value: str) -> str:
+        """
+        Return `value` if it is one of the model names, checked by set membership.
+
+        Raises:
+            ValueError: If `value` is not one of the names above
+        """
+        if value not in _VALUES:
+            raise ValueError(f"{value!r} is not a valid OpenAIModels value")
+        return value
+
+
+# Read-only name -> model string registry, e.g. MODELS["gpt4o"]
+MODELS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        name: value
+        for name, value in vars(OpenAIModels).items()
+        if not name.startswith("_") and isinstance(value, str)
+    }
+)
 
-    def __str__(self):
-        return self.value
+_VALUES: frozenset[str] = frozenset(MODELS.values())
@@ -4,69 +4,138 @@ Example Usage of OpenAI Client Module
 This file demonstrates different ways to use the openai_client module.
 """
 
-from openai import OpenAIError
-
-# Method 1: Import the pre-initialized client
-from utils.openai_client import client
-
-# Method 2: Import the function to create a new client instance
-from utils.openai_client import get_openai_client
-
-
-def example_with_global_client():
+import os
+import asyncio
+import logging
+
+from openai import (
+    APIConnectionError,
+    InternalServerError,
+    OpenAIError,
+    RateLimitError,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from enums.ai_models import OpenAIModels
+
+# Method 1: Import the pre-initialized (async) client
+from utils.openai_client import async_client
+
+# Method 2: Import the function to create a new (async) client instance
+from utils.openai_client import get_async_openai_client
+
+logger = logging.getLogger(__name__)
+
+
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=10),
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception_type(
+        (APIConnectionError, RateLimitError, InternalServerError)
+    ),
+    reraise=True,
+)
+async def create_chat_stream(client, **kwargs):
+    """Start a streamed chat completion, retrying transient API failures."""
+    # tenacity owns the retries here, so switch off the SDK's own (2 by default)
+    return await client.with_options(max_retries=0).chat.completions.create(
+        stream=True, **kwargs
+    )
+
+
+async def emit_stream(stream, emit=print):
+    """Emit a streamed chat completion piece by piece as it arrives."""
+    async for event in stream:
+        if event.choices and event.choices[0].delta.content:
+            emit(event.choices[0].delta.content, end="")
+    emit("")
+
+
+async def example_with_global_client(emit=print):
     """Example using the global client instance."""
-    if not client:
-        print("Error: OpenAI client is not available.")
+    if not async_client:
+        logger.error("OpenAI client is not available.")
         return
 
     try:
-        response = client.chat.completions.create(
-            model="openai/gpt-4o",
+        async with await create_chat_stream(
+            async_client,
+            model=OpenAIModels.gpt4o,
             messages=[{"role": "user", "content": "Hello! How are you today?"}],
-        )
-
-        if response.choices:
-            print("Response using global client:")
-            print(response.choices[0].message.content)
+        ) as stream:
+            emit("Response using global client:")
+            await emit_stream(stream, emit)
 
     except OpenAIError as e:
-        print(f"OpenAI API error: {e}")
+        logger.error("OpenAI API error: %s", e)
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
 
 
-def example_with_function_client():
+async def example_with_function_client(emit=print):
     """Example creating a new client instance using the function."""
     try:
-        # Create a new client instance
-        my_client = get_openai_client()
+        # Get the client (built on the first call, shared afterwards)
+        my_client = get_async_openai_client()
 
-        response = my_client.chat.completions.create(
-            model="openai/gpt-4o",
+        async with await create_chat_stream(
+            my_client,
+            model=OpenAIModels.gpt4o,
             messages=[
                 {
                     "role": "user",
                     "content": "Tell me a fun fact about Python programming.",
                 }
             ],
-        )
-
-        if response.choices:
-            print("\nResponse using function-created client:")
-            print(response.choices[0].message.content)
+        ) as stream:
+            emit("\nResponse using function-created client:")
+            await emit_stream(stream, emit)
 
     except ValueError as e:
-        print(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
     except OpenAIError as e:
-        print(f"OpenAI API error: {e}")
+        logger.error("OpenAI API error: %s", e)
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
+
+
+async def run_examples(examples):
+    """
+    Run the examples concurrently, printing their output in order.
+
+    The first example streams straight to the terminal; the others' output
+    queues up meanwhile and is printed (then streamed live) in turn.
+    """
+
+    async def run(example, output):
+        try:
+            await example(lambda text, end="\n": output.put_nowait(text + end))
+        finally:
+            output.put_nowait(None)
+
+    outputs = [asyncio.Queue() for _ in examples]
+    tasks = [
+        asyncio.create_task(run(example, output))
+        for example, output in zip(examples, outputs)
+    ]
+    for output in outputs:
+        while (text := await output.get()) is not None:
+            print(text, end="", flush=True)
+    await asyncio.gather(*tasks)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING"))
     print("OpenAI Client Module Usage Examples")
     print("=" * 40)
 
-    # Run both examples
-    example_with_global_client()
-    example_with_function_client()
+    # The two requests are independent, so both are in flight at once:
+    # total time is the slower of the two rather than their sum
+    asyncio.run(
+        run_examples([example_with_global_client, example_with_function_client])
+    )
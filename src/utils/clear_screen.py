@@ -0,0 +1,9 @@
+import sys
+
+
+def clear_screen() -> None:
+    # ANSI clear + cursor home: one write instead of forking a shell for `clear`.
+    # Skipped when stdout is not a terminal so piped/CI logs stay clean.
+    if sys.stdout.isatty():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
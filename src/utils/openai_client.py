@@ -7,50 +7,182 @@ initialization with proper error handling.
 """
 
 import os
+import atexit
+import threading
+from functools import lru_cache
+from importlib.util import find_spec
+
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI, OpenAIError
 
+DEFAULT_BASE_URL = "https://router.requesty.ai/v1"
 
-def get_openai_client():
-    """
-    Initialize and return an OpenAI client configured for Requesty.ai.
+# httpx only speaks HTTP/2 with the optional `h2` package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
 
-    Returns:
-        OpenAI: Configured OpenAI client instance
 
-    Raises:
-        ValueError: If REQUESTY_API_KEY is not found in environment variables
-        OpenAIError: If there's an issue initializing the OpenAI client
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Read the .env file into the environment once per process."""
+    return load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
     """
-    # Load environment variables from .env file
-    load_dotenv()
+    One connection pool for every OpenAI client built here, closed at exit.
 
-    # Safely load your API key from environment
-    requesty_api_key = os.getenv("REQUESTY_API_KEY")
+    Uses HTTP/2 when `h2` is installed, HTTP/1.1 keep-alive otherwise.
+    DefaultHttpxClient keeps the SDK's own defaults (timeouts, redirects);
+    only the pool settings are changed.
+    """
+    http_client = DefaultHttpxClient(
+        http2=HTTP2_AVAILABLE, limits=httpx.Limits(max_keepalive_connections=20)
+    )
+    atexit.register(http_client.close)
+    return http_client
 
-    if not requesty_api_key:
-        raise ValueError("REQUESTY_API_KEY not found in environment variables.")
 
+def _warm_up(http_client: httpx.Client, base_url: str) -> None:
+    """Open a pooled connection (DNS + TCP + TLS) to the API ahead of use."""
     try:
+        http_client.head(base_url, timeout=2)
+    except httpx.HTTPError:
+        pass  # Only an optimisation; the first real request will connect
+
+
+@lru_cache(maxsize=4)
+def _build_client(
+    api_key: str, base_url: str, http_client: httpx.Client | None
+) -> OpenAI:
+    """
+    Build the OpenAI client for an API key, endpoint and HTTP client, once.
+
+    Every caller with the same arguments shares the instance; by default all
+    instances also share one underlying HTTP connection pool.
+    """
+    try:
+        http_client = http_client or _shared_http_client()
         # Initialize OpenAI client
         client = OpenAI(
-            api_key=requesty_api_key,
-            base_url="https://router.requesty.ai/v1",
+            api_key=api_key,
+            base_url=base_url,
+            http_client=http_client,
             # default_headers={
             #     "HTTP-Referer": "<YOUR_SITE_URL>",  # Optional
             #     "X-Title": "<YOUR_SITE_NAME>",  # Optional
             # },
         )
-        return client
 
     except Exception as e:
         raise OpenAIError(f"Failed to initialize OpenAI client: {e}") from e
 
+    # Connect in the background while the caller builds its first request.
+    # Only over HTTP/2, where that request can share the pending connection;
+    # over HTTP/1.1 the warm-up would hold the only pooled connection and an
+    # immediate first request would pay a second handshake instead
+    if HTTP2_AVAILABLE:
+        threading.Thread(
+            target=_warm_up, args=(http_client, base_url), daemon=True
+        ).start()
+    return client
+
+
+def get_openai_client(
+    base_url: str | None = None, http_client: httpx.Client | None = None
+):
+    """
+    Return the shared OpenAI client configured for Requesty.ai.
+
+    The client is built on the first call and reused afterwards, one per
+    endpoint.
+
+    Args:
+        base_url (str | None): API endpoint. Defaults to $OPENAI_BASE_URL,
+            then to the Requesty.ai router.
+        http_client (httpx.Client | None): Connection pool to send requests
+            through. Defaults to one pool shared by every client from here.
+
+    Returns:
+        OpenAI: Configured OpenAI client instance
+
+    Raises:
+        ValueError: If REQUESTY_API_KEY is not found in environment variables
+        OpenAIError: If there's an issue initializing the OpenAI client
+    """
+    base_url = base_url or os.getenv("OPENAI_BASE_URL", DEFAULT_BASE_URL)
+    return _build_client(_requesty_api_key(), base_url, http_client)
+
+
+@lru_cache(maxsize=4)
+def _build_async_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    """
+    Build the AsyncOpenAI client for an API key and endpoint, once.
+    """
+    try:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+    except Exception as e:
+        raise OpenAIError(f"Failed to initialize OpenAI client: {e}") from e
+
+
+def get_async_openai_client(base_url: str | None = None):
+    """
+    Return the shared AsyncOpenAI client configured for Requesty.ai.
+
+    Same configuration as get_openai_client(), for code that awaits its
+    requests (e.g. several at once with asyncio.gather).
+
+    Args:
+        base_url (str | None): API endpoint. Defaults to $OPENAI_BASE_URL,
+            then to the Requesty.ai router.
+
+    Returns:
+        AsyncOpenAI: Configured async OpenAI client instance
+
+    Raises:
+        ValueError: If REQUESTY_API_KEY is not found in environment variables
+        OpenAIError: If there's an issue initializing the OpenAI client
+    """
+    base_url = base_url or os.getenv("OPENAI_BASE_URL", DEFAULT_BASE_URL)
+    return _build_async_client(_requesty_api_key(), base_url)
 
-# Create a global client instance for convenience
-try:
-    client = get_openai_client()
 
-except (ValueError, OpenAIError) as e:
-    print(f"Warning: Could not initialize OpenAI client: {e}")
-    client = None
+def _requesty_api_key() -> str:
+    # Safely load your API key from environment; only fall back to the .env
+    # file (parsed on the first miss only) when it isn't set there already
+    requesty_api_key = os.getenv("REQUESTY_API_KEY")
+    if not requesty_api_key:
+        _load_env()
+        requesty_api_key = os.getenv("REQUESTY_API_KEY")
+
+    if not requesty_api_key:
+        raise ValueError("REQUESTY_API_KEY not found in environment variables.")
+
+    return requesty_api_key
+
+
+# Global clients, built on first access
+_GLOBAL_CLIENTS = {"client": get_openai_client, "async_client": get_async_openai_client}
+
+
+def __getattr__(name):
+    """
+    Build the global `client` / `async_client` on first access (PEP 562).
+
+    Importing the module, or only `get_openai_client`, no longer constructs
+    a client. If one can't be built, it is None, as before.
+    """
+    if name in _GLOBAL_CLIENTS:
+        try:
+            client = _GLOBAL_CLIENTS[name]()
+
+        except (ValueError, OpenAIError) as e:
+            print(f"Warning: Could not initialize OpenAI client: {e}")
+            client = None
+
+        globals()[name] = client
+        return client
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")